@@ -6,6 +6,8 @@ from the .env file or actual environment variables.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,6 +18,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # ── Azure Voice Live ────────────────────────────────────────────
@@ -43,4 +46,12 @@ class Settings(BaseSettings):
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     log_level: str = "INFO"
+    app_reload: bool = False
+    app_workers: int = 1
     enable_proactive_greeting: bool = True
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing ``.env`` only once."""
+    return Settings()
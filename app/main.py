@@ -9,23 +9,55 @@ WS   /ws/voice    WebSocket endpoint for voice sessions
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
 import logging
 from contextlib import asynccontextmanager
+from typing import Any, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, Response
 
-from app.config import Settings
-from app.service import VoiceLiveSessionManager
+from app.config import get_settings
+from app.service import VoiceLiveSessionManager, close_agent_token_cache, warm_up
+
+settings = get_settings()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp within the same second.
+
+    The date format has second resolution, so ``strftime`` only needs to run
+    when the wall-clock second changes rather than once per record.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
 
-settings = Settings()
 
 # ── Logging ──────────────────────────────────────────────────────────
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper(), logging.INFO),
-    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+LOG_LEVEL = getattr(logging, settings.log_level.upper(), logging.INFO)
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    _CachedTimeFormatter(
+        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
 )
+logging.basicConfig(level=LOG_LEVEL, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 
@@ -40,8 +72,13 @@ async def lifespan(_app: FastAPI):
         settings.azure_voicelive_voice_name,
         settings.azure_voicelive_voice_endpoint_id,
     )
+    # Runs in the background so startup is never blocked on AAD or DNS
+    warm_up_task = asyncio.create_task(warm_up(settings), name="warm-up")
     yield
     logger.info("Voice Live API server shutting down")
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+    await close_agent_token_cache()
 
 
 # ── Application ──────────────────────────────────────────────────────
@@ -57,10 +94,13 @@ app = FastAPI(
 
 
 # ── Health ───────────────────────────────────────────────────────────
+_HEALTH_BODY = b'{"status":"healthy","service":"voice-live-api"}'
+
+
 @app.get("/health")
 async def health_check():
     """Liveness / readiness probe."""
-    return JSONResponse({"status": "healthy", "service": "voice-live-api"})
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # ── WebSocket ────────────────────────────────────────────────────────
@@ -95,10 +135,46 @@ async def voice_websocket_endpoint(websocket: WebSocket):
 
 
 # ── Browser Test Client ──────────────────────────────────────────────
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` header allows gzip.
+
+    An explicit ``gzip`` entry decides; otherwise ``*`` does. Either one is
+    refused by ``q=0``.
+    """
+    wildcard = False
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        allowed = True
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    allowed = float(value) > 0
+                except ValueError:
+                    pass
+        if name == "gzip":
+            return allowed
+        wildcard = allowed
+    return wildcard
+
+
 @app.get("/", response_class=HTMLResponse)
-async def test_client():
+async def test_client(request: Request):
     """Serve a minimal browser-based test client for development."""
-    return _TEST_CLIENT_HTML
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body, headers = _TEST_CLIENT_GZIP, _TEST_CLIENT_GZIP_HEADERS
+    else:
+        body, headers = _TEST_CLIENT_BYTES, _TEST_CLIENT_HEADERS
+
+    etag = headers["etag"]
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304, headers={"etag": etag, **_TEST_CLIENT_CACHE_HEADERS}
+        )
+    return HTMLResponse(body, headers=headers)
 
 
 # ── Run directly ─────────────────────────────────────────────────────
@@ -110,7 +186,8 @@ if __name__ == "__main__":
         host=settings.app_host,
         port=settings.app_port,
         log_level=settings.log_level.lower(),
-        reload=True,
+        reload=settings.app_reload,
+        workers=1 if settings.app_reload else settings.app_workers,
     )
 
 
@@ -196,29 +273,76 @@ function addMsg(text, cls) {
   d.scrollIntoView({ behavior: 'smooth' });
 }
 
-/* ── PCM helpers ──────────────────────────────────────────────── */
-function float32ToPcm16(f32) {
-  const buf = new Int16Array(f32.length);
-  for (let i = 0; i < f32.length; i++) {
-    const s = Math.max(-1, Math.min(1, f32[i]));
-    buf[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+/* ── PCM capture worklet ─────────────────────────────────────── */
+// Runs on the audio rendering thread: clamps/converts Float32 samples to
+// PCM16 and posts ~85 ms frames to the main thread as transferred buffers.
+const PCM_WORKLET_SRC = `
+class PcmCaptureProcessor extends AudioWorkletProcessor {
+  constructor() {
+    super();
+    this.frame = new Int16Array(2048);
+    this.filled = 0;
+  }
+  process(inputs) {
+    const channels = inputs[0];
+    if (channels.length === 0) return true;
+    const f32 = channels[0];
+    for (let i = 0; i < f32.length; i++) {
+      const s = f32[i];
+      this.frame[this.filled++] = (s < -1 ? -1 : s > 1 ? 1 : s) * 0x7FFF;
+      if (this.filled === this.frame.length) {
+        this.port.postMessage(this.frame.buffer, [this.frame.buffer]);
+        this.frame = new Int16Array(2048);
+        this.filled = 0;
+      }
+    }
+    return true;
   }
-  return buf;
 }
-
-function pcm16ToFloat32(pcm) {
-  const f = new Float32Array(pcm.length);
-  for (let i = 0; i < pcm.length; i++) f[i] = pcm[i] / 32768.0;
-  return f;
+registerProcessor('pcm-capture', PcmCaptureProcessor);
+`;
+
+async function createCaptureNode(ctx) {
+  const url = URL.createObjectURL(
+    new Blob([PCM_WORKLET_SRC], { type: 'application/javascript' }));
+  try {
+    await ctx.audioWorklet.addModule(url);
+  } finally {
+    URL.revokeObjectURL(url);
+  }
+  return new AudioWorkletNode(ctx, 'pcm-capture');
 }
 
 /* ── Playback scheduler ──────────────────────────────────────── */
+// Incoming chunks are merged until ~40 ms of audio is pending (or 20 ms
+// has passed) so one AudioBufferSourceNode covers several network deltas.
+const COALESCE_SAMPLES = 960;
+const COALESCE_WAIT_MS = 20;
+let pendingChunks = [], pendingSamples = 0, flushTimer = null;
+
 function playChunk(arrayBuffer) {
   if (!playbackCtx) return;
   const pcm = new Int16Array(arrayBuffer);
-  const f32 = pcm16ToFloat32(pcm);
-  const buf = playbackCtx.createBuffer(1, f32.length, 24000);
-  buf.getChannelData(0).set(f32);
+  pendingChunks.push(pcm);
+  pendingSamples += pcm.length;
+  if (pendingSamples >= COALESCE_SAMPLES) flushPlayback();
+  else if (!flushTimer) flushTimer = setTimeout(flushPlayback, COALESCE_WAIT_MS);
+}
+
+function flushPlayback() {
+  if (flushTimer) { clearTimeout(flushTimer); flushTimer = null; }
+  const chunks = pendingChunks, total = pendingSamples;
+  pendingChunks = []; pendingSamples = 0;
+  if (!playbackCtx || total === 0) return;
+
+  const buf = playbackCtx.createBuffer(1, total, 24000);
+  const out = buf.getChannelData(0);
+  let off = 0;
+  for (const pcm of chunks) {
+    for (let i = 0; i < pcm.length; i++) out[off + i] = pcm[i] / 32768.0;
+    off += pcm.length;
+  }
+
   const src = playbackCtx.createBufferSource();
   src.buffer = buf;
   src.connect(playbackCtx.destination);
@@ -250,11 +374,9 @@ async function startSession() {
       nextPlayTime = 0;
 
       const source = audioCtx.createMediaStreamSource(mediaStream);
-      processor = audioCtx.createScriptProcessor(4096, 1, 1);
-      processor.onaudioprocess = e => {
-        if (ws && ws.readyState === WebSocket.OPEN) {
-          ws.send(float32ToPcm16(e.inputBuffer.getChannelData(0)).buffer);
-        }
+      processor = await createCaptureNode(audioCtx);
+      processor.port.onmessage = e => {
+        if (ws && ws.readyState === WebSocket.OPEN) ws.send(e.data);
       };
       source.connect(processor);
       processor.connect(audioCtx.destination);
@@ -288,8 +410,10 @@ async function startSession() {
 }
 
 function cleanup() {
-  if (processor) { processor.disconnect(); processor = null; }
+  if (processor) { processor.port.onmessage = null; processor.disconnect(); processor = null; }
   if (audioCtx)  { audioCtx.close(); audioCtx = null; }
+  if (flushTimer) { clearTimeout(flushTimer); flushTimer = null; }
+  pendingChunks = []; pendingSamples = 0;
   if (playbackCtx) { playbackCtx.close(); playbackCtx = null; }
   if (mediaStream) { mediaStream.getTracks().forEach(t => t.stop()); mediaStream = null; }
   $('startBtn').disabled = false;
@@ -305,3 +429,21 @@ function stopSession() {
 </body>
 </html>
 """
+
+# Encoded and compressed once at import so each request serves cached bytes
+_TEST_CLIENT_BYTES = _TEST_CLIENT_HTML.encode("utf-8")
+_TEST_CLIENT_GZIP = gzip.compress(_TEST_CLIENT_BYTES, compresslevel=9, mtime=0)
+_TEST_CLIENT_DIGEST = hashlib.sha1(_TEST_CLIENT_BYTES).hexdigest()
+_TEST_CLIENT_CACHE_HEADERS = {
+    "cache-control": "no-cache",
+    "vary": "accept-encoding",
+}
+_TEST_CLIENT_HEADERS = {
+    "etag": '"%s"' % _TEST_CLIENT_DIGEST,
+    **_TEST_CLIENT_CACHE_HEADERS,
+}
+_TEST_CLIENT_GZIP_HEADERS = {
+    "etag": '"%s-gzip"' % _TEST_CLIENT_DIGEST,
+    "content-encoding": "gzip",
+    **_TEST_CLIENT_CACHE_HEADERS,
+}
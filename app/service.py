@@ -24,11 +24,14 @@ Server -> Client
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
+import binascii
+import functools
 import logging
-from typing import Any, Optional
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Coroutine, Optional
 
+import orjson
 from azure.ai.voicelive.aio import VoiceLiveConnection, connect
 from azure.ai.voicelive.models import (
     AudioEchoCancellation,
@@ -41,7 +44,7 @@ from azure.ai.voicelive.models import (
     ServerEventType,
     ServerVad,
 )
-from azure.core.credentials import AzureKeyCredential
+from azure.core.credentials import AccessToken, AzureKeyCredential
 from azure.identity.aio import ClientSecretCredential
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -49,6 +52,166 @@ from app.config import Settings
 
 logger = logging.getLogger(__name__)
 
+_EventHandler = Callable[[Any], Awaitable[None]]
+
+_AGENT_TOKEN_SCOPE = "https://ai.azure.com/.default"
+
+# Client audio is coalesced before being appended to Voice Live: flush once
+# 40 ms of PCM16 24 kHz mono (48 bytes/ms) is buffered, or 20 ms after the
+# first buffered byte, whichever comes first.
+_INPUT_FLUSH_BYTES = 40 * 48
+_INPUT_FLUSH_DELAY_S = 0.02
+
+# Chunks allowed to wait for the Voice Live sender before the oldest is
+# dropped; bounds input latency if the upstream socket stalls.
+_INPUT_QUEUE_SIZE = 8
+
+# Agent audio deltas are coalesced into fewer client frames: flush once 8 KiB
+# (~170 ms of PCM16 24 kHz mono) is buffered, or 20 ms after the first
+# buffered delta, and always before a control frame so ordering is kept.
+_OUTPUT_FLUSH_BYTES = 8192
+_OUTPUT_FLUSH_DELAY_S = 0.02
+
+# Agent audio allowed to wait for a slow client (10 s of PCM16 24 kHz mono)
+# before the oldest queued audio is dropped. Control frames are never dropped.
+_OUTPUT_MAX_AUDIO_BYTES = 10 * 24_000 * 2
+
+# Upper bound on delivering leftover control frames (e.g. an error) at teardown
+_TEARDOWN_SEND_TIMEOUT_S = 1.0
+
+# Constant control frames, serialized once instead of on every send
+_STATUS_FRAMES = {
+    status: orjson.dumps({"type": "status", "status": status}).decode()
+    for status in ("listening", "processing", "agent_speaking", "ready")
+}
+_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+
+# Exact framing produced by JSON.stringify({type: "audio", audio: b64})
+_AUDIO_FRAME_PREFIX = '{"type":"audio","audio":"'
+_AUDIO_FRAME_SUFFIX = '"}'
+
+# Service error codes that only mean a barge-in cancel raced the response end
+_BENIGN_ERROR_CODES = frozenset({"response_cancel_not_active"})
+
+
+class _AgentTokenCache:
+    """Process-wide cache for the Foundry agent access token.
+
+    Keeps one ``ClientSecretCredential`` for the life of the process and
+    reuses its token until shortly before expiry, so concurrent sessions
+    share a single AAD round-trip instead of each minting their own.
+    """
+
+    _REFRESH_MARGIN_S = 300
+
+    def __init__(self) -> None:
+        self._credential: Optional[ClientSecretCredential] = None
+        self._token: Optional[AccessToken] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._token is not None
+            and time.time() < self._token.expires_on - self._REFRESH_MARGIN_S
+        )
+
+    async def get(self, settings: Settings) -> str:
+        """Return a valid agent access token, refreshing it if needed."""
+        if not self._is_fresh():
+            async with self._lock:
+                if not self._is_fresh():
+                    if self._credential is None:
+                        self._credential = ClientSecretCredential(
+                            tenant_id=settings.azure_tenant_id,
+                            client_id=settings.azure_client_id,
+                            client_secret=settings.azure_client_secret,
+                        )
+                    self._token = await self._credential.get_token(
+                        _AGENT_TOKEN_SCOPE
+                    )
+                    logger.info("Acquired agent access token via service principal")
+        assert self._token is not None
+        return self._token.token
+
+    async def close(self) -> None:
+        """Close the underlying credential and drop the cached token."""
+        credential, self._credential = self._credential, None
+        self._token = None
+        if credential is not None:
+            await credential.close()
+
+
+_agent_token_cache = _AgentTokenCache()
+
+
+@functools.lru_cache(maxsize=None)
+def build_session_config(settings: Settings) -> RequestSession:
+    """Build the ``session.update`` payload for the given settings.
+
+    Every field is derived from (immutable) settings, so the result is cached
+    and shared by all sessions instead of being rebuilt on each connect.
+    """
+    voice_config = AzureCustomVoice(
+        name=settings.azure_voicelive_voice_name,
+        endpoint_id=settings.azure_voicelive_voice_endpoint_id,
+    )
+
+    turn_detection = ServerVad(
+        threshold=settings.vad_threshold,
+        prefix_padding_ms=settings.vad_prefix_padding_ms,
+        silence_duration_ms=settings.vad_silence_duration_ms,
+    )
+
+    return RequestSession(
+        modalities=[Modality.TEXT, Modality.AUDIO],
+        voice=voice_config,
+        input_audio_format=InputAudioFormat.PCM16,
+        output_audio_format=OutputAudioFormat.PCM16,
+        turn_detection=turn_detection,
+        input_audio_echo_cancellation=AudioEchoCancellation(),
+        input_audio_noise_reduction=AudioNoiseReduction(
+            type="azure_deep_noise_suppression"
+        ),
+    )
+
+
+async def close_agent_token_cache() -> None:
+    """Release the shared service principal credential (call on shutdown)."""
+    await _agent_token_cache.close()
+
+
+async def warm_up(settings: Settings) -> None:
+    """Pay one-time session-start costs before the first client connects.
+
+    Builds the cached session config and fetches the agent access token.
+    Failures are only logged; the first session simply performs the work
+    itself.
+    """
+    build_session_config(settings)
+
+    try:
+        await _agent_token_cache.get(settings)
+    except Exception:
+        logger.warning("Agent token prefetch failed", exc_info=True)
+
+
+def _compact_audio_payload(text: str) -> Optional[str]:
+    """Slice the base64 payload out of a compact JSON audio frame.
+
+    Returns ``None`` for any other text (including differently formatted or
+    escaped audio frames), which the caller then parses as JSON. This skips
+    a full parse of a multi-KB string just to pull the payload back out.
+    """
+    if text.startswith(_AUDIO_FRAME_PREFIX) and text.endswith(_AUDIO_FRAME_SUFFIX):
+        payload = text[len(_AUDIO_FRAME_PREFIX) : -len(_AUDIO_FRAME_SUFFIX)]
+        if '"' not in payload and "\\" not in payload:
+            return payload
+    return None
+
+
+class _RelayFinished(Exception):
+    """Raised when one relay loop ends, to tear down the whole task group."""
+
 
 class VoiceLiveSessionManager:
     """Manages one Voice Live session, bridging a client WebSocket to Azure.
@@ -66,6 +229,50 @@ class VoiceLiveSessionManager:
         self._active_response: bool = False
         self._response_api_done: bool = False
         self._conversation_started: bool = False
+        # Set on barge-in: deltas of the cancelled response are skipped
+        self._audio_suppressed: bool = False
+
+        # Client audio waiting to be appended to Voice Live: raw PCM is
+        # coalesced in _pcm_buf, then queued (as bytes, or as base64 str for
+        # JSON audio frames) for the dedicated sender task.
+        self._pcm_buf = bytearray()
+        self._input_q: asyncio.Queue[bytes | str] = asyncio.Queue(
+            maxsize=_INPUT_QUEUE_SIZE
+        )
+        self._input_dropped: int = 0
+
+        # Frames for the client are queued for a dedicated writer task, so a
+        # slow client never stalls the Voice Live event loop. Agent audio is
+        # first coalesced in _out_buf, then queued as one binary frame.
+        self._out_buf = bytearray()
+        self._out_flush_timer: Optional[asyncio.TimerHandle] = None
+        self._out_frames: deque[bytes | str] = deque()
+        self._out_ready = asyncio.Event()
+        self._out_audio_bytes: int = 0
+        self._out_dropped: int = 0
+
+        # Resolved once so per-event debug logging costs nothing when off
+        self._log_events: bool = logger.isEnabledFor(logging.DEBUG)
+
+        # Event type -> bound handler, resolved with one dict lookup per event
+        self._dispatch: dict[str, _EventHandler] = {
+            ServerEventType.SESSION_UPDATED: self._on_session_updated,
+            ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED: (
+                self._on_user_transcript
+            ),
+            ServerEventType.RESPONSE_TEXT_DONE: self._on_agent_text,
+            ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE: self._on_agent_transcript,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED: self._on_speech_started,
+            ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED: self._on_speech_stopped,
+            ServerEventType.RESPONSE_CREATED: self._on_response_created,
+            ServerEventType.RESPONSE_AUDIO_DELTA: self._on_response_audio_delta,
+            ServerEventType.RESPONSE_AUDIO_DONE: self._on_response_audio_done,
+            ServerEventType.RESPONSE_DONE: self._on_response_done,
+            ServerEventType.ERROR: self._on_error,
+            ServerEventType.CONVERSATION_ITEM_CREATED: (
+                self._on_conversation_item_created
+            ),
+        }
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -99,8 +306,9 @@ class VoiceLiveSessionManager:
             logger.info("Client WebSocket disconnected")
         except Exception:
             logger.exception("Voice Live session error")
-            await self._send_error("Internal session error")
+            self._send_error("Internal session error")
         finally:
+            await self._send_pending_control_frames()
             self._connection = None
 
     # ------------------------------------------------------------------
@@ -114,24 +322,15 @@ class VoiceLiveSessionManager:
 
         Uses API key for the Voice Live WebSocket connection and a service
         principal (client credentials) to mint the Foundry agent access token.
+        The token is shared across sessions and refreshed before it expires.
         All values come from .env -- no interactive ``az login`` required.
         """
         # 1. API key credential for the Voice Live connection
         vl_credential = AzureKeyCredential(self._settings.azure_voicelive_api_key)
         logger.info("Using API key credential for Voice Live connection")
 
-        # 2. Agent access token via service principal (client credentials flow)
-        sp_credential = ClientSecretCredential(
-            tenant_id=self._settings.azure_tenant_id,
-            client_id=self._settings.azure_client_id,
-            client_secret=self._settings.azure_client_secret,
-        )
-        try:
-            token = await sp_credential.get_token("https://ai.azure.com/.default")
-            agent_token = token.token
-            logger.info("Acquired agent access token via service principal")
-        finally:
-            await sp_credential.close()
+        # 2. Agent access token via service principal (cached per process)
+        agent_token = await _agent_token_cache.get(self._settings)
 
         return vl_credential, agent_token
 
@@ -143,119 +342,131 @@ class VoiceLiveSessionManager:
         """Send ``session.update`` with voice, VAD, echo-cancel & noise-reduce."""
         assert self._connection is not None
 
-        voice_config = self._build_voice_config()
-
-        turn_detection = ServerVad(
-            threshold=self._settings.vad_threshold,
-            prefix_padding_ms=self._settings.vad_prefix_padding_ms,
-            silence_duration_ms=self._settings.vad_silence_duration_ms,
-        )
-
-        session_config = RequestSession(
-            modalities=[Modality.TEXT, Modality.AUDIO],
-            voice=voice_config,
-            input_audio_format=InputAudioFormat.PCM16,
-            output_audio_format=OutputAudioFormat.PCM16,
-            turn_detection=turn_detection,
-            input_audio_echo_cancellation=AudioEchoCancellation(),
-            input_audio_noise_reduction=AudioNoiseReduction(
-                type="azure_deep_noise_suppression"
-            ),
-        )
-
+        session_config = build_session_config(self._settings)
         await self._connection.session.update(session=session_config)
         logger.info("Session configuration sent")
 
-    def _build_voice_config(self) -> AzureCustomVoice:
-        """Build the custom neural voice configuration from settings."""
-        return AzureCustomVoice(
-            name=self._settings.azure_voicelive_voice_name,
-            endpoint_id=self._settings.azure_voicelive_voice_endpoint_id,
-        )
-
     # ------------------------------------------------------------------
     # Relay loops
     # ------------------------------------------------------------------
 
     async def _run_relay_loops(self) -> None:
-        """Run client->VL and VL->client tasks; cancel peer on first exit."""
-        client_task = asyncio.create_task(
-            self._relay_client_to_voicelive(), name="client-to-vl"
-        )
-        events_task = asyncio.create_task(
-            self._relay_voicelive_to_client(), name="vl-to-client"
-        )
-        tasks = [client_task, events_task]
-
+        """Run the relay tasks; cancel the others when the first one exits."""
         try:
-            done, pending = await asyncio.wait(
-                tasks, return_when=asyncio.FIRST_COMPLETED
-            )
-            # Cancel the surviving task
-            for task in pending:
-                task.cancel()
-            await asyncio.gather(*pending, return_exceptions=True)
-
-            # Re-raise real exceptions from completed tasks
-            for task in done:
-                if not task.cancelled():
-                    exc = task.exception()
-                    if exc is not None:
-                        raise exc
-        finally:
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-
-    async def _relay_client_to_voicelive(self) -> None:
-        """Forward audio from the client WebSocket to Voice Live."""
-        assert self._connection is not None
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    self._exit_group_when_done(self._recv_from_client()),
+                    name="client-to-queue",
+                )
+                tg.create_task(
+                    self._exit_group_when_done(self._send_to_voicelive()),
+                    name="queue-to-vl",
+                )
+                tg.create_task(
+                    self._exit_group_when_done(self._relay_voicelive_to_client()),
+                    name="vl-to-queue",
+                )
+                tg.create_task(
+                    self._exit_group_when_done(self._send_to_client()),
+                    name="queue-to-client",
+                )
+        except ExceptionGroup as group:
+            # Re-raise the first real error; _RelayFinished only ends the group
+            for exc in group.exceptions:
+                if not isinstance(exc, _RelayFinished):
+                    raise exc
+
+    @staticmethod
+    async def _exit_group_when_done(coro: Coroutine[Any, Any, None]) -> None:
+        """Await a relay loop, then raise so the task group cancels its peers."""
+        await coro
+        raise _RelayFinished
+
+    async def _recv_from_client(self) -> None:
+        """Read client frames and queue their audio for Voice Live."""
+        loop = asyncio.get_running_loop()
+        flush_deadline: Optional[float] = None
+
+        # Bound once: these are used for every frame
+        receive = self._ws.receive
+        pcm_buf = self._pcm_buf
+        flush = self._flush_input_audio
 
         while True:
             try:
-                data = await self._ws.receive()
+                async with asyncio.timeout_at(flush_deadline):
+                    data = await receive()
+            except TimeoutError:
+                flush_deadline = None
+                flush()
+                continue
             except WebSocketDisconnect:
                 logger.info("Client disconnected during audio relay")
+                flush()
                 return
 
-            ws_type = data.get("type", "")
-            if ws_type == "websocket.disconnect":
-                return
-
-            # ── Binary frame: raw PCM16 audio ───────────────────────
+            # ── Binary frame: raw PCM16 audio (checked first) ───────
             raw_bytes: Optional[bytes] = data.get("bytes")
             if raw_bytes:
-                audio_b64 = base64.b64encode(raw_bytes).decode("utf-8")
-                await self._connection.input_audio_buffer.append(audio=audio_b64)
+                pcm_buf += raw_bytes
+                if len(pcm_buf) >= _INPUT_FLUSH_BYTES:
+                    flush_deadline = None
+                    flush()
+                elif flush_deadline is None:
+                    flush_deadline = loop.time() + _INPUT_FLUSH_DELAY_S
                 continue
 
+            if data.get("type") == "websocket.disconnect":
+                flush()
+                return
+
             # ── Text frame: JSON command ─────────────────────────────
             text: Optional[str] = data.get("text")
-            if text:
+            if not text:
+                continue
+
+            audio_b64 = _compact_audio_payload(text)
+            if audio_b64 is None:
                 try:
-                    msg = json.loads(text)
-                except json.JSONDecodeError:
+                    msg = orjson.loads(text)
+                except orjson.JSONDecodeError:
                     logger.warning("Invalid JSON from client: %.100s", text)
                     continue
 
                 msg_type = msg.get("type", "")
-                if msg_type == "audio":
-                    audio_b64 = msg.get("audio", "")
-                    if audio_b64:
-                        await self._connection.input_audio_buffer.append(
-                            audio=audio_b64
-                        )
-                elif msg_type == "ping":
-                    await self._send_json({"type": "pong"})
+                if msg_type == "ping":
+                    self._send_text(_PONG_FRAME)
+                    continue
+                if msg_type != "audio":
+                    continue
+                audio_b64 = msg.get("audio", "")
+
+            if audio_b64:
+                # Keep ordering with any buffered binary audio
+                flush_deadline = None
+                flush()
+                self._enqueue_input_audio(audio_b64)
+
+    async def _send_to_voicelive(self) -> None:
+        """Append queued client audio to the Voice Live input buffer."""
+        queue = self._input_q
+        append = self._append_audio
+
+        while True:
+            chunk = await queue.get()
+            if isinstance(chunk, bytes):
+                chunk = binascii.b2a_base64(chunk, newline=False).decode("ascii")
+            await append(chunk)
 
     async def _relay_voicelive_to_client(self) -> None:
-        """Iterate Voice Live events and forward to the client WebSocket."""
+        """Iterate Voice Live events and queue the resulting client frames."""
         assert self._connection is not None
+        handle = self._handle_event
 
         async for event in self._connection:
             try:
-                await self._handle_event(event)
-            except (asyncio.CancelledError, WebSocketDisconnect):
+                await handle(event)
+            except asyncio.CancelledError:
                 raise
             except Exception:
                 logger.exception(
@@ -263,128 +474,277 @@ class VoiceLiveSessionManager:
                     getattr(event, "type", "unknown"),
                 )
 
+    async def _send_to_client(self) -> None:
+        """Write queued frames to the client WebSocket, in order."""
+        frames = self._out_frames
+        ready = self._out_ready
+        send_frame = self._send_frame
+
+        while True:
+            while not frames:
+                ready.clear()
+                await ready.wait()
+            frame = frames.popleft()
+            if isinstance(frame, bytes):
+                self._out_audio_bytes -= len(frame)
+            if not await send_frame(frame):
+                return
+
     # ------------------------------------------------------------------
     # Event handling
     # ------------------------------------------------------------------
 
-    async def _handle_event(self, event: Any) -> None:  # noqa: C901
-        """Route and process a single Voice Live server event."""
+    async def _handle_event(self, event: Any) -> None:
+        """Route a single Voice Live server event to its handler."""
         assert self._connection is not None
         event_type = event.type
-        logger.debug("Event: %s", event_type)
-
-        # ── Session ready ────────────────────────────────────────────
-        if event_type == ServerEventType.SESSION_UPDATED:
-            session_id = getattr(event.session, "id", "unknown")
-            logger.info("Session ready: %s", session_id)
-            await self._send_json(
-                {"type": "session_started", "session_id": session_id}
+        if self._log_events:
+            logger.debug("Event: %s", event_type)
+
+        handler = self._dispatch.get(event_type)
+        if handler is None:
+            if self._log_events:
+                logger.debug("Unhandled event: %s", event_type)
+            return
+        await handler(event)
+
+    # ── Session ready ────────────────────────────────────────────────
+
+    async def _on_session_updated(self, event: Any) -> None:
+        """Announce the session and optionally request a proactive greeting."""
+        session_id = getattr(event.session, "id", "unknown")
+        logger.info("Session ready: %s", session_id)
+        self._send_json({"type": "session_started", "session_id": session_id})
+
+        if self._settings.enable_proactive_greeting and not self._conversation_started:
+            self._conversation_started = True
+            try:
+                await self._connection.response.create()
+                logger.info("Proactive greeting requested")
+            except Exception:
+                logger.exception("Failed to request proactive greeting")
+
+    # ── Transcripts and text ─────────────────────────────────────────
+
+    async def _on_user_transcript(self, event: Any) -> None:
+        """Forward the completed user speech transcript."""
+        transcript = event.get("transcript", "")
+        logger.info("User: %s", transcript)
+        self._send_json({"type": "user_transcript", "text": transcript})
+
+    async def _on_agent_text(self, event: Any) -> None:
+        """Forward a completed agent text response."""
+        text = event.get("text", "")
+        logger.info("Agent text: %s", text)
+        self._send_json({"type": "agent_text", "text": text})
+
+    async def _on_agent_transcript(self, event: Any) -> None:
+        """Forward the completed transcript of the agent's audio."""
+        transcript = event.get("transcript", "")
+        logger.info("Agent transcript: %s", transcript)
+        self._send_json({"type": "agent_transcript", "text": transcript})
+
+    # ── User speech (potential barge-in) ─────────────────────────────
+
+    async def _on_speech_started(self, event: Any) -> None:
+        """Report listening and cancel any in-flight response (barge-in)."""
+        logger.info("Speech started")
+        barge_in = self._active_response and not self._response_api_done
+        if barge_in:
+            # Drop the interrupted response's audio before "listening" is
+            # queued, so none of it reaches the client after the user speaks
+            self._audio_suppressed = True
+            self._discard_output_audio()
+        self._send_text(_STATUS_FRAMES["listening"])
+
+        if barge_in:
+            # cancel() only sends the request; a response that already ended
+            # comes back as an ERROR event (see _on_error), not an exception.
+            try:
+                await self._connection.response.cancel()
+                logger.info("Cancelled active response (barge-in)")
+            except Exception as exc:
+                logger.warning("Cancel failed: %s", exc)
+
+    async def _on_speech_stopped(self, event: Any) -> None:
+        """Report that the user's turn is being processed."""
+        logger.info("Speech stopped")
+        self._send_text(_STATUS_FRAMES["processing"])
+
+    # ── Response lifecycle ───────────────────────────────────────────
+
+    async def _on_response_created(self, event: Any) -> None:
+        """Mark a response as active."""
+        self._active_response = True
+        self._response_api_done = False
+        self._audio_suppressed = False
+        self._send_text(_STATUS_FRAMES["agent_speaking"])
+
+    async def _on_response_audio_delta(self, event: Any) -> None:
+        """Buffer an agent audio chunk for the next binary frame."""
+        if self._audio_suppressed:
+            # Checked before reading ``delta``, which the SDK decodes lazily
+            return
+        # The SDK already decodes ``delta`` (a base64 field) to bytes
+        audio_data = event.delta
+        if not audio_data:
+            return
+
+        out_buf = self._out_buf
+        out_buf += audio_data
+        if len(out_buf) >= _OUTPUT_FLUSH_BYTES:
+            self._flush_output_audio()
+        elif self._out_flush_timer is None:
+            self._out_flush_timer = asyncio.get_running_loop().call_later(
+                _OUTPUT_FLUSH_DELAY_S, self._flush_output_audio
             )
 
-            if (
-                self._settings.enable_proactive_greeting
-                and not self._conversation_started
-            ):
-                self._conversation_started = True
-                try:
-                    await self._connection.response.create()
-                    logger.info("Proactive greeting requested")
-                except Exception:
-                    logger.exception("Failed to request proactive greeting")
-
-        # ── User transcript ──────────────────────────────────────────
-        elif (
-            event_type
-            == ServerEventType.CONVERSATION_ITEM_INPUT_AUDIO_TRANSCRIPTION_COMPLETED
-        ):
-            transcript = event.get("transcript", "")
-            logger.info("User: %s", transcript)
-            await self._send_json({"type": "user_transcript", "text": transcript})
-
-        # ── Agent text response ──────────────────────────────────────
-        elif event_type == ServerEventType.RESPONSE_TEXT_DONE:
-            text = event.get("text", "")
-            logger.info("Agent text: %s", text)
-            await self._send_json({"type": "agent_text", "text": text})
-
-        # ── Agent audio transcript ───────────────────────────────────
-        elif event_type == ServerEventType.RESPONSE_AUDIO_TRANSCRIPT_DONE:
-            transcript = event.get("transcript", "")
-            logger.info("Agent transcript: %s", transcript)
-            await self._send_json({"type": "agent_transcript", "text": transcript})
-
-        # ── User started speaking (potential barge-in) ───────────────
-        elif event_type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            logger.info("Speech started")
-            await self._send_json({"type": "status", "status": "listening"})
-
-            if self._active_response and not self._response_api_done:
-                try:
-                    await self._connection.response.cancel()
-                    logger.info("Cancelled active response (barge-in)")
-                except Exception as exc:
-                    msg = str(exc).lower()
-                    if "no active response" in msg:
-                        logger.debug("Cancel ignored - already completed")
-                    else:
-                        logger.warning("Cancel failed: %s", exc)
-
-        # ── User stopped speaking ────────────────────────────────────
-        elif event_type == ServerEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED:
-            logger.info("Speech stopped")
-            await self._send_json({"type": "status", "status": "processing"})
-
-        # ── Response lifecycle ───────────────────────────────────────
-        elif event_type == ServerEventType.RESPONSE_CREATED:
-            self._active_response = True
-            self._response_api_done = False
-            await self._send_json({"type": "status", "status": "agent_speaking"})
-
-        elif event_type == ServerEventType.RESPONSE_AUDIO_DELTA:
-            audio_data = event.delta
-            if audio_data:
-                if isinstance(audio_data, bytes):
-                    await self._ws.send_bytes(audio_data)
-                else:
-                    await self._ws.send_bytes(base64.b64decode(audio_data))
-
-        elif event_type == ServerEventType.RESPONSE_AUDIO_DONE:
-            logger.info("Agent audio complete")
-            await self._send_json({"type": "status", "status": "ready"})
-
-        elif event_type == ServerEventType.RESPONSE_DONE:
-            self._active_response = False
-            self._response_api_done = True
-
-        # ── Errors ───────────────────────────────────────────────────
-        elif event_type == ServerEventType.ERROR:
-            error_msg = getattr(event.error, "message", str(event))
-            if "no active response" in error_msg.lower():
-                logger.debug("Benign cancellation error")
-            else:
-                logger.error("VoiceLive error: %s", error_msg)
-                await self._send_json({"type": "error", "message": error_msg})
-
-        # ── Informational ────────────────────────────────────────────
-        elif event_type == ServerEventType.CONVERSATION_ITEM_CREATED:
-            logger.debug(
-                "Conversation item: %s", getattr(event.item, "id", "")
-            )
+    async def _on_response_audio_done(self, event: Any) -> None:
+        """Report that agent audio has finished."""
+        logger.info("Agent audio complete")
+        self._send_text(_STATUS_FRAMES["ready"])
+
+    async def _on_response_done(self, event: Any) -> None:
+        """Mark the active response as complete."""
+        self._active_response = False
+        self._response_api_done = True
 
+    # ── Errors and informational ─────────────────────────────────────
+
+    async def _on_error(self, event: Any) -> None:
+        """Forward service errors, ignoring benign cancellation races."""
+        error_code = getattr(event.error, "code", None)
+        error_msg = getattr(event.error, "message", str(event))
+        if error_code in _BENIGN_ERROR_CODES or (
+            error_code is None and "no active response" in error_msg.lower()
+        ):
+            logger.debug("Benign cancellation error")
         else:
-            logger.debug("Unhandled event: %s", event_type)
+            logger.error("VoiceLive error: %s", error_msg)
+            self._send_json({"type": "error", "message": error_msg})
+
+    async def _on_conversation_item_created(self, event: Any) -> None:
+        """Log newly created conversation items."""
+        logger.debug("Conversation item: %s", getattr(event.item, "id", ""))
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    async def _send_json(self, payload: dict) -> None:
-        """Send a JSON text frame to the client WebSocket."""
+    def _flush_input_audio(self) -> None:
+        """Queue any buffered client PCM to be appended as one event."""
+        if not self._pcm_buf:
+            return
+        self._enqueue_input_audio(bytes(self._pcm_buf))
+        self._pcm_buf.clear()
+
+    def _enqueue_input_audio(self, chunk: bytes | str) -> None:
+        """Queue audio for the sender, dropping the oldest chunk when full."""
+        if self._input_q.full():
+            self._input_q.get_nowait()
+            self._input_dropped += 1
+            if self._input_dropped == 1:
+                logger.warning("Voice Live send backlog; dropping oldest input audio")
+        self._input_q.put_nowait(chunk)
+
+    def _flush_output_audio(self) -> None:
+        """Queue buffered agent audio as one binary frame (also a timer callback)."""
+        if self._out_flush_timer is not None:
+            self._out_flush_timer.cancel()
+            self._out_flush_timer = None
+        if not self._out_buf:
+            return
+        chunk = bytes(self._out_buf)
+        self._out_buf.clear()
+        self._push_output(chunk)
+
+    def _discard_output_audio(self) -> None:
+        """Drop agent audio that is buffered or queued but not yet sent."""
+        if self._out_flush_timer is not None:
+            self._out_flush_timer.cancel()
+            self._out_flush_timer = None
+        self._out_buf.clear()
+        frames = self._out_frames
+        if self._out_audio_bytes:
+            kept = [frame for frame in frames if not isinstance(frame, bytes)]
+            frames.clear()
+            frames.extend(kept)
+            self._out_audio_bytes = 0
+
+    def _push_output(self, frame: bytes | str) -> None:
+        """Queue a frame for the writer, dropping the oldest audio on backlog."""
+        frames = self._out_frames
+        frames.append(frame)
+        if isinstance(frame, bytes):
+            self._out_audio_bytes += len(frame)
+            while self._out_audio_bytes > _OUTPUT_MAX_AUDIO_BYTES:
+                oldest = next(f for f in frames if isinstance(f, bytes))
+                frames.remove(oldest)
+                self._out_audio_bytes -= len(oldest)
+                self._out_dropped += 1
+                if self._out_dropped == 1:
+                    logger.warning("Client send backlog; dropping oldest agent audio")
+        self._out_ready.set()
+
+    async def _send_frame(self, frame: bytes | str) -> bool:
+        """Send one frame to the client; return ``False`` once it is gone.
+
+        Starlette's send_bytes/send_text only wrap send(), so the ASGI
+        message is built here and that layer is skipped for every frame.
+        """
+        if isinstance(frame, bytes):
+            message = {"type": "websocket.send", "bytes": frame}
+        else:
+            message = {"type": "websocket.send", "text": frame}
         try:
-            await self._ws.send_text(json.dumps(payload))
-        except Exception:
-            logger.debug("Failed to send JSON to client", exc_info=True)
+            await self._ws.send(message)
+        except (WebSocketDisconnect, RuntimeError) as exc:
+            # Client went away or the socket is already closed
+            logger.debug("Stopped sending to client: %r", exc)
+            return False
+        return True
+
+    async def _send_pending_control_frames(self) -> None:
+        """Send control frames still queued once the relay has stopped.
+
+        Leftover agent audio is stale by then and is dropped, and the sends
+        are time-boxed so teardown never waits long on a slow client.
+        """
+        self._discard_output_audio()
+        frames = self._out_frames
+        try:
+            async with asyncio.timeout(_TEARDOWN_SEND_TIMEOUT_S):
+                while frames:
+                    if not await self._send_frame(frames.popleft()):
+                        break
+        except TimeoutError:
+            logger.debug("Timed out sending final frames to client")
+        frames.clear()
+
+    async def _append_audio(self, audio_b64: str) -> None:
+        """Append base64 PCM16 audio to the Voice Live input buffer.
+
+        The Voice Live protocol only accepts audio inside a JSON event, so the
+        base64 step stays; sending a plain mapping skips building a
+        ``ClientEventInputAudioBufferAppend`` model for every frame.
+        """
+        assert self._connection is not None
+        await self._connection.send(
+            {"type": "input_audio_buffer.append", "audio": audio_b64}
+        )
+
+    def _send_json(self, payload: dict) -> None:
+        """Queue a JSON text frame for the client WebSocket."""
+        self._send_text(orjson.dumps(payload).decode())
+
+    def _send_text(self, text: str) -> None:
+        """Queue an already-serialized text frame for the client WebSocket.
+
+        Buffered agent audio is queued first so frames keep their order.
+        """
+        self._flush_output_audio()
+        self._push_output(text)
 
-    async def _send_error(self, message: str) -> None:
-        """Send an error message to the client WebSocket."""
-        await self._send_json({"type": "error", "message": message})
+    def _send_error(self, message: str) -> None:
+        """Queue an error message for the client WebSocket."""
+        self._send_json({"type": "error", "message": message})